@@ -7,18 +7,27 @@ from dotenv import load_dotenv
 
 from .workflow import QuantInvestWorkflow
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows.
+    uvloop = None
+
 DEV_UI_PORT = 8090
 
 
+_TASK_TEMPLATE = (
+    "Analyze {ticker} from {start} to {end}. Develop one transparent technical-analysis "
+    "signal strategy as Python code, execute it, backtest ${capital}, and report CAGR, "
+    "total return, final value, drawdown, and Sharpe ratio."
+)
+
+
 def task() -> str:
-    ticker = os.getenv("INVESTMENT_TICKER", "MSFT")
-    start = os.getenv("INVESTMENT_START_DATE", "2020-01-01")
-    end = os.getenv("INVESTMENT_END_DATE", "2026-07-01")
-    capital = os.getenv("INVESTMENT_INITIAL_CAPITAL", "10000")
-    return (
-        f"Analyze {ticker} from {start} to {end}. Develop one transparent technical-analysis "
-        f"signal strategy as Python code, execute it, backtest ${capital}, and report CAGR, "
-        "total return, final value, drawdown, and Sharpe ratio."
+    return _TASK_TEMPLATE.format(
+        ticker=os.getenv("INVESTMENT_TICKER", "MSFT"),
+        start=os.getenv("INVESTMENT_START_DATE", "2020-01-01"),
+        end=os.getenv("INVESTMENT_END_DATE", "2026-07-01"),
+        capital=os.getenv("INVESTMENT_INITIAL_CAPITAL", "10000"),
     )
 
 
@@ -43,4 +52,4 @@ if __name__ == "__main__":
         print(f"Agent Framework output directory: {workflow.work_dir.resolve()}")
         serve(entities=[built], port=DEV_UI_PORT, auto_open=False)
     else:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
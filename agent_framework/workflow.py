@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import cache
 import json
 import os
 from pathlib import Path
@@ -22,6 +24,33 @@ from typing_extensions import Never
 from .research_repl import DATASET_SIGNALS
 from .tools import AgentTools, WORK_DIR
 
+_SIGNAL_PROMPT = "Original request:\n{task}\n\nData-agent result:\n{data}"
+_BACKTEST_PROMPT = "Original request:\n{task}\n\nSignal-agent result:\n{signal}"
+
+
+@dataclass(frozen=True)
+class FoundrySettings:
+    """Foundry project connection read once from the environment."""
+
+    project_endpoint: str
+    model: str
+
+
+@cache
+def foundry_settings() -> FoundrySettings:
+    """Return the Foundry settings, failing fast when a required variable is unset."""
+    names = ("AZURE_AI_PROJECT_ENDPOINT", "AZURE_AI_MODEL_DEPLOYMENT_NAME")
+    missing = [name for name in names if not os.getenv(name)]
+    if missing:
+        raise ValueError(
+            f"Set {' and '.join(missing)} in .env or the process environment "
+            "before creating the Agent Framework workflow."
+        )
+    return FoundrySettings(
+        project_endpoint=os.environ["AZURE_AI_PROJECT_ENDPOINT"],
+        model=os.environ["AZURE_AI_MODEL_DEPLOYMENT_NAME"],
+    )
+
 
 class QuantInvestWorkflow:
     """Foundry agents that author, execute, and evaluate a signal script."""
@@ -34,9 +63,10 @@ class QuantInvestWorkflow:
         self.tools = AgentTools(self.work_dir)
 
     async def create_workflow(self) -> Workflow:
+        settings = foundry_settings()
         client = FoundryChatClient(
-            project_endpoint=os.environ["AZURE_AI_PROJECT_ENDPOINT"],
-            model=os.environ["AZURE_AI_MODEL_DEPLOYMENT_NAME"],
+            project_endpoint=settings.project_endpoint,
+            model=settings.model,
             credential=AzureCliCredential(),
         )
         self.agents = {
@@ -95,21 +125,14 @@ class QuantInvestWorkflow:
         @executor(id="generate_signals")
         async def signal(message: str, ctx: WorkflowContext[str]) -> None:
             state = self._parse_state(message)
-            prompt = (
-                f"Original request:\n{state['task']}\n\n"
-                f"Data-agent result:\n{state['data']}"
-            )
-            result = await self.agents["signal"].run(prompt)
+            result = await self.agents["signal"].run(_SIGNAL_PROMPT.format(**state))
             state["signal"] = result.text
             await ctx.send_message(self._state(**state))
 
         @executor(id="backtest")
         async def run_backtest(message: str, ctx: WorkflowContext[str]) -> None:
             state = self._parse_state(message)
-            result = await self.agents["backtest"].run(
-                f"Original request:\n{state['task']}\n\n"
-                f"Signal-agent result:\n{state['signal']}"
-            )
+            result = await self.agents["backtest"].run(_BACKTEST_PROMPT.format(**state))
             state["backtest"] = result.text
             await ctx.send_message(self._state(**state))
 
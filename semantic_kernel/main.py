@@ -12,16 +12,25 @@ from dotenv import load_dotenv
 
 from .workflow import InvestmentWorkflow
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows.
+    uvloop = None
+
+
+_TASK_TEMPLATE = (
+    "Analyze {ticker} from {start} to {end}. Develop one transparent technical-analysis "
+    "signal strategy as Python code, execute it, backtest ${capital}, and report CAGR, "
+    "total return, final value, drawdown, and Sharpe ratio."
+)
+
 
 def task() -> str:
-    ticker = os.getenv("INVESTMENT_TICKER", "MSFT")
-    start = os.getenv("INVESTMENT_START_DATE", "2020-01-01")
-    end = os.getenv("INVESTMENT_END_DATE", "2026-07-01")
-    capital = os.getenv("INVESTMENT_INITIAL_CAPITAL", "10000")
-    return (
-        f"Analyze {ticker} from {start} to {end}. Develop one transparent technical-analysis "
-        f"signal strategy as Python code, execute it, backtest ${capital}, and report CAGR, "
-        "total return, final value, drawdown, and Sharpe ratio."
+    return _TASK_TEMPLATE.format(
+        ticker=os.getenv("INVESTMENT_TICKER", "MSFT"),
+        start=os.getenv("INVESTMENT_START_DATE", "2020-01-01"),
+        end=os.getenv("INVESTMENT_END_DATE", "2026-07-01"),
+        capital=os.getenv("INVESTMENT_INITIAL_CAPITAL", "10000"),
     )
 
 
@@ -36,4 +45,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)